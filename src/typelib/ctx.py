@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import contextlib
 import typing as tp
 import typing_extensions as te
 
@@ -16,11 +15,13 @@ KeyT = te.TypeAliasType("KeyT", "type | refs.ForwardRef")
 class TypeContext(dict[KeyT, ValueT], tp.Generic[ValueT]):
     """A key-value mapping which can map between forward references and real types."""
 
+    __slots__ = ()
+
     def get(self, key: KeyT, default: ValueT | DefaultT = None) -> ValueT | DefaultT:
-        with contextlib.suppress(KeyError):
+        try:
             return self[key]
-
-        return default
+        except KeyError:
+            return default
 
     def __missing__(self, key: type | refs.ForwardRef):
         """Hook to handle missing type references.
@@ -29,7 +29,6 @@ from typelib.py import classes, compat, inspection, refs
 __all__ = ("static_order", "itertypes", "get_type_graph")
 
 
-@compat.cache
 def static_order(
     t: type | str | refs.ForwardRef | compat.TypeAliasType,
 ) -> typing.Sequence[TypeNode]:
@@ -44,18 +43,26 @@ def static_order(
 
         This function is memoized to avoid the cost of re-computing a type annotation
         multiple times at runtime, which would be wasted effort, as types don't change
-        at runtime.
+        at runtime. The memoized nodes are held in a tuple, and each call returns a new
+        list of them, so callers can't alter the cached result.
 
         To avoid memoization, you can make use of [`itertypes`][typelib.graph.itertypes].
     """
+    return [*_static_order(t)]
+
+
+@compat.cache
+def _static_order(
+    t: type | str | refs.ForwardRef | compat.TypeAliasType,
+) -> tuple[TypeNode, ...]:
     # We want to leverage the cache if possible, hence the recursive call.
     #   Shouldn't actually recurse more than once or twice.
     if isinstance(t, (str, refs.ForwardRef)):
         ref = refs.forwardref(t) if isinstance(t, str) else t
         t = refs.evaluate(ref)
-        return static_order(t)
+        return _static_order(t)
 
-    return [*itertypes(t)]
+    return (*itertypes(t),)
 
 
 def itertypes(
@@ -339,10 +339,16 @@ def itervalues(val: t.Any) -> t.Iterator[t.Any]:
     Args:
         val: The object to iterate over.
     """
+    # Builtin sequences and sets already iterate over their values.
+    if val.__class__ in _VALUE_ITERABLES:
+        return iter(val)
     iterate = get_items_iter(val.__class__)
     return (v for k, v in iterate(val))
 
 
+_VALUE_ITERABLES = frozenset((list, tuple, set, frozenset))
+
+
 @compat.cache
 def get_items_iter(tp: type) -> t.Callable[[t.Any], t.Iterable[tuple[t.Any, t.Any]]]:
     """Given a type, return a callable which will produce an iterator over (field, value) pairs.
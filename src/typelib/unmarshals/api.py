@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import threading
 import typing as tp
+import weakref
 
 from typelib import ctx, graph
 from typelib.py import compat, inspection, refs
@@ -12,6 +14,7 @@ T = tp.TypeVar("T")
 
 __all__ = (
     "unmarshal",
+    "unmarshal_many",
     "unmarshaller",
     "DelayedUnmarshaller",
 )
@@ -29,6 +32,24 @@ def unmarshal(t: type[T] | refs.ForwardRef | str, value: tp.Any) -> T:
     return unmarshalled
 
 
+def unmarshal_many(
+    t: type[T] | refs.ForwardRef | str, values: tp.Iterable[tp.Any]
+) -> list[T]:
+    """Unmarshal each of `values` into `t`.
+
+    Notes:
+        The unmarshaller for `t` is resolved once for the whole batch, rather than
+        once per value.
+
+    Args:
+        t: The type annotation or reference to unmarshal into.
+        values: The values to unmarshal.
+    """
+    routine = unmarshaller(t)
+    unmarshalled = routine.call_many(values)
+    return unmarshalled
+
+
 @compat.cache
 def unmarshaller(
     t: type[T] | refs.ForwardRef | compat.TypeAliasType | str,
@@ -47,10 +68,23 @@ def unmarshaller(
     # "root" type will always be the final node in the sequence.
     root = nodes[-1]
     for node in nodes:
-        context[node.type] = _get_unmarshaller(node, context=context)
-        context[node.unwrapped] = context[node.type]
-
-    return context[root.type]
+        # Share routines for nodes we've already built for another root type.
+        #   Nodes don't compare on `cyclic`, but it changes the routine we build.
+        key = (node, node.cyclic)
+        routine = _ROUTINES_BY_NODE.get(key)
+        if routine is None:
+            routine = _get_unmarshaller(node, context=context)
+            routine = _ROUTINES_BY_NODE.setdefault(key, routine)
+        context[node.type] = routine
+        context[node.unwrapped] = routine
+
+    routine = context[root.type]
+    # The shared no-op is bound to `typing.Any`, so give the root its own.
+    if routine is _NOOP:
+        routine = routines.NoOpUnmarshaller(
+            root.unwrapped, context=context, var=root.var
+        )
+    return routine
 
 
 def _get_unmarshaller(  # type: ignore[return]
@@ -60,13 +94,24 @@ def _get_unmarshaller(  # type: ignore[return]
     if node.type in context:
         return context[node.type]
 
+    # Short-circuit forward refs, there's no need to walk the handlers.
+    if node.unwrapped.__class__ in (refs.ForwardRef, str):
+        return DelayedUnmarshaller(node.unwrapped, context=context, var=node.var)
+
+    unmarshaller_cls = _get_unmarshaller_cls(node.unwrapped)
+    # No-ops are type-independent, so we can share a single instance.
+    if unmarshaller_cls is routines.NoOpUnmarshaller:
+        return _NOOP
+    return unmarshaller_cls(node.unwrapped, context=context, var=node.var)
+
+
+@compat.cache
+def _get_unmarshaller_cls(t: tp.Any) -> type[routines.AbstractUnmarshaller]:
     for check, unmarshaller_cls in _HANDLERS.items():
-        if check(node.unwrapped):
-            return unmarshaller_cls(node.unwrapped, context=context, var=node.var)
+        if check(t):
+            return unmarshaller_cls
 
-    return routines.StructuredTypeUnmarshaller(
-        node.unwrapped, context=context, var=node.var
-    )
+    return routines.StructuredTypeUnmarshaller
 
 
 class DelayedUnmarshaller(routines.AbstractUnmarshaller[T]):
@@ -87,14 +132,64 @@ class DelayedUnmarshaller(routines.AbstractUnmarshaller[T]):
     def resolved(self) -> routines.AbstractUnmarshaller[T]:
         """The resolved unmarshaller."""
         if self._resolved is None:
-            self._resolved = unmarshaller(self.t)
-            for attr in self._resolved.__slots__:
-                setattr(self, attr, getattr(self._resolved, attr))
-        return self._resolved
+            # Concurrent first calls should only build the type graph once.
+            with _RESOLUTION_LOCK:
+                if self._resolved is None:
+                    self._resolve()
+        return self._resolved  # type: ignore[return-value]
+
+    def _resolve(self) -> None:
+        resolved = unmarshaller(self.t)
+        for attr in _slotnames(resolved.__class__):
+            setattr(self, attr, getattr(resolved, attr))
+        self._resolved = resolved
 
     def __call__(self, val: tp.Any) -> T:
-        unmarshalled = self.resolved(val)
-        return unmarshalled
+        # We remain a proxy: routines are slotted and we are not, so we can't assume
+        #   the resolved routine's class. Skip the property once we've resolved.
+        resolved = self._resolved
+        if resolved is None:
+            resolved = self.resolved
+        return resolved(val)
+
+
+@compat.cache
+def _issubscriptedmapping(t: tp.Any) -> bool:
+    return inspection.issubscriptedgeneric(t) and inspection.ismappingtype(t)
+
+
+@compat.cache
+def _issubscriptediterator(t: tp.Any) -> bool:
+    return inspection.issubscriptedgeneric(t) and inspection.isiteratortype(t)
+
+
+@compat.cache
+def _issubscriptediterable(t: tp.Any) -> bool:
+    return inspection.issubscriptedgeneric(t) and inspection.isiterabletype(t)
+
+
+_RESOLUTION_LOCK = threading.RLock()
+# Weakly held, so routines are released once no cached unmarshaller uses them.
+_ROUTINES_BY_NODE: weakref.WeakValueDictionary[
+    tuple[graph.TypeNode, bool], routines.AbstractUnmarshaller
+] = weakref.WeakValueDictionary()
+_NOOP: routines.NoOpUnmarshaller = routines.NoOpUnmarshaller(
+    t=tp.Any,  # type: ignore[arg-type]
+    context=ctx.TypeContext(),
+    var=None,
+)
+
+
+@compat.cache
+def _slotnames(cls: type) -> tuple[str, ...]:
+    # Every slot across the MRO, so we copy a resolved routine's full state.
+    #   The field name (`var`) belongs to the proxy's position in its graph, so keep it.
+    return tuple(
+        s
+        for c in cls.__mro__
+        for s in c.__dict__.get("__slots__", ())
+        if not s.startswith("__") and s != "var"
+    )
 
 
 # Order is IMPORTANT! This is a FIFO queue.
@@ -111,33 +206,30 @@ _HANDLERS: tp.Mapping[
     inspection.isuniontype: routines.UnionUnmarshaller,
     # Special handling for Enums
     inspection.isenumtype: routines.EnumUnmarshaller,
-    # Non-intersecting types (order doesn't matter here.
+    # Mostly non-intersecting types, ranked by how often they show up in a typical
+    #   model. Datetimes must be checked before dates, since they're a subclass.
+    #   Decimals and fractions are also numbers, so they stay ahead of the general
+    #   number check, though all three resolve to the number unmarshaller.
+    inspection.isstringtype: routines.StringUnmarshaller,
+    inspection.isdecimaltype: routines.DecimalUnmarshaller,
+    inspection.isfractiontype: routines.FractionUnmarshaller,
+    inspection.isnumbertype: routines.NumberUnmarshaller,
     inspection.isdatetimetype: routines.DateTimeUnmarshaller,
     inspection.isdatetype: routines.DateUnmarshaller,
+    inspection.isuuidtype: routines.UUIDUnmarshaller,
+    inspection.isbytestype: routines.BytesUnmarshaller,
     inspection.istimetype: routines.TimeUnmarshaller,
     inspection.istimedeltatype: routines.TimeDeltaUnmarshaller,
-    inspection.isuuidtype: routines.UUIDUnmarshaller,
-    inspection.ispatterntype: routines.PatternUnmarshaller,
     inspection.ispathtype: routines.PathUnmarshaller,
-    inspection.isdecimaltype: routines.DecimalUnmarshaller,
-    inspection.isfractiontype: routines.FractionUnmarshaller,
-    inspection.isnumbertype: routines.NumberUnmarshaller,
-    inspection.isstringtype: routines.StringUnmarshaller,
-    inspection.isbytestype: routines.BytesUnmarshaller,
+    inspection.ispatterntype: routines.PatternUnmarshaller,
     # Psuedo-structured containers, should check before generics.
     inspection.istypeddict: routines.StructuredTypeUnmarshaller,
     inspection.istypedtuple: routines.StructuredTypeUnmarshaller,
     inspection.isnamedtuple: routines.StructuredTypeUnmarshaller,
     inspection.isfixedtupletype: routines.FixedTupleUnmarshaller,
-    (
-        lambda t: inspection.issubscriptedgeneric(t) and inspection.ismappingtype(t)
-    ): routines.SubscriptedMappingUnmarshaller,
-    (
-        lambda t: inspection.issubscriptedgeneric(t) and inspection.isiteratortype(t)
-    ): routines.SubscriptedIteratorUnmarshaller,
-    (
-        lambda t: inspection.issubscriptedgeneric(t) and inspection.isiterabletype(t)
-    ): routines.SubscriptedIterableUnmarshaller,
+    _issubscriptedmapping: routines.SubscriptedMappingUnmarshaller,
+    _issubscriptediterator: routines.SubscriptedIteratorUnmarshaller,
+    _issubscriptediterable: routines.SubscriptedIterableUnmarshaller,
     # A mapping is a collection so must come before that check.
     inspection.ismappingtype: routines.MappingUnmarshaller,
     # Generic iterator handler
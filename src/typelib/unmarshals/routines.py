@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import abc
-import contextlib
 import datetime
 import decimal
 import enum
@@ -76,7 +75,7 @@ class AbstractUnmarshaller(abc.ABC, tp.Generic[T]):
     context: ContextT
     var: str | None
 
-    __slots__ = ("t", "origin", "context", "var")
+    __slots__ = ("t", "origin", "context", "var", "__weakref__")
 
     def __repr__(self):
         return f"<{self.__class__.__name__}(type={self.t!r}, origin={self.origin!r}, var={self.var!r})>"
@@ -101,12 +100,25 @@ class AbstractUnmarshaller(abc.ABC, tp.Generic[T]):
         Not implemented for the abstract base class.
         """
 
+    def call_many(self, vals: tp.Iterable[tp.Any]) -> list[T]:
+        """Unmarshall a batch of Python objects into their target type.
+
+        Args:
+            vals: The input values to unmarshal.
+        """
+        return [*map(self, vals)]
+
 
 class NoOpUnmarshaller(AbstractUnmarshaller[T]):
     """Unmarshaller that does nothing."""
 
+    __slots__ = ()
+
     def __call__(self, val: tp.Any) -> T:
-        return tp.cast(T, val)
+        return val  # type: ignore[no-any-return]
+
+    def call_many(self, vals: tp.Iterable[tp.Any]) -> list[T]:
+        return [*vals]
 
 
 class NoneTypeUnmarshaller(AbstractUnmarshaller[None]):
@@ -119,6 +131,8 @@ class NoneTypeUnmarshaller(AbstractUnmarshaller[None]):
         - [`typelib.serdes.decode`][]
     """
 
+    __slots__ = ()
+
     def __call__(self, val: tp.Any) -> None:
         """Unmarshal the given input into a `None` value.
 
@@ -128,13 +142,33 @@ class NoneTypeUnmarshaller(AbstractUnmarshaller[None]):
         Raises:
             ValueError: If `val` is not `None` after decoding.
         """
-        decoded = serdes.decode(val)
+        decoded = serdes.decode(val) if isinstance(val, _BYTES_TYPES) else val
         if decoded is not None:
             raise ValueError(f"{val!r} is not of {types.NoneType!r}")
         return None
 
 
 ContextT: tp.TypeAlias = "ctx.TypeContext[AbstractUnmarshaller]"
+# Hoisted type tuples for our `isinstance` checks.
+_DATETIME_TYPES = (datetime.date, datetime.time, datetime.timedelta)
+# Exact classes for the above, so the common case is a single hash lookup.
+_DATETIME_CLASSES = frozenset(
+    (datetime.date, datetime.datetime, datetime.time, datetime.timedelta)
+)
+_TIMESTAMP_TYPES = (int, float)
+# Inputs which `serdes.decode` will actually decode, everything else is passed through.
+_BYTES_TYPES = (bytes, bytearray, memoryview)
+# Hoisted date/time constants for our hot paths.
+_UTC = datetime.timezone.utc
+_fromtimestamp = datetime.datetime.fromtimestamp
+# Errors which indicate the input doesn't fit a given union member.
+_UNION_MEMBER_ERRORS = (ValueError, TypeError, SyntaxError, AttributeError)
+# Builtin, non-text types which `serdes.load` would hand back unchanged.
+_NATIVE_TYPES = frozenset(
+    (dict, list, tuple, set, frozenset, int, float, bool, type(None))
+)
+# Sentinel for missing keys, since `None` may be a valid input value.
+_MISSING = object()
 BytesT = tp.TypeVar("BytesT", bound=bytes)
 
 
@@ -148,13 +182,21 @@ class BytesUnmarshaller(AbstractUnmarshaller[BytesT], tp.Generic[BytesT]):
         - [`typelib.serdes.isoformat`][]
     """
 
+    __slots__ = ()
+
     def __call__(self, val: tp.Any) -> BytesT:
-        if isinstance(val, self.t):
+        t = self.t
+        # Exact type matches are the most common case, and the cheapest check.
+        cls = val.__class__
+        if cls is t or isinstance(val, t):
             return val
+        # Plain strings can be encoded directly.
+        if cls is str:
+            return t(val.encode(constants.DEFAULT_ENCODING))
         # Always encode date/time as ISO strings.
-        if isinstance(val, (datetime.date, datetime.time, datetime.timedelta)):
+        if cls in _DATETIME_CLASSES or isinstance(val, _DATETIME_TYPES):
             val = serdes.isoformat(val)
-        return self.t(str(val).encode(constants.DEFAULT_ENCODING))
+        return t(str(val).encode(constants.DEFAULT_ENCODING))
 
 
 StringT = tp.TypeVar("StringT", bound=str)
@@ -170,18 +212,28 @@ class StringUnmarshaller(AbstractUnmarshaller[StringT], tp.Generic[StringT]):
         - [`typelib.serdes.isoformat`][]
     """
 
+    __slots__ = ()
+
     def __call__(self, val: tp.Any) -> StringT:
+        t = self.t
+        cls = val.__class__
+        if cls is t:
+            return val
+        # Plain strings only need a cast to the bound subclass.
+        if cls is str:
+            return t(val)
         # Always decode bytes.
-        decoded = serdes.decode(val)
-        if isinstance(decoded, self.t):
+        decoded = serdes.decode(val) if isinstance(val, _BYTES_TYPES) else val
+        if isinstance(decoded, t):
             return decoded
         # Always encode date/time as ISO strings.
-        if isinstance(val, (datetime.date, datetime.time, datetime.timedelta)):
+        if cls in _DATETIME_CLASSES or isinstance(val, _DATETIME_TYPES):
             decoded = serdes.isoformat(val)
-        return self.t(decoded)
+        return t(decoded)
 
 
 NumberT = tp.TypeVar("NumberT", bound=numbers.Number)
+_PRIMITIVE_NUMBER_INPUTS = frozenset((int, float, str))
 
 
 class NumberUnmarshaller(AbstractUnmarshaller[NumberT], tp.Generic[NumberT]):
@@ -202,28 +254,44 @@ class NumberUnmarshaller(AbstractUnmarshaller[NumberT], tp.Generic[NumberT]):
         - [`typelib.serdes.unixtime`][]
     """
 
+    __slots__ = ()
+
     def __call__(self, val: tp.Any) -> NumberT:
         """Unmarshall a value into the bound Number type.
 
         Args:
             val: The input value to unmarshal.
         """
+        t = self.t
+        if val.__class__ is t:
+            return val
+        # Fast-path primitive inputs, which can be passed directly to the constructor.
+        if val.__class__ in _PRIMITIVE_NUMBER_INPUTS:
+            return val if isinstance(val, t) else t(val)  # type: ignore[call-arg]
         # Always decode bytes.
-        decoded = serdes.decode(val)
-        if isinstance(decoded, self.t):
+        decoded = serdes.decode(val) if isinstance(val, _BYTES_TYPES) else val
+        if isinstance(decoded, t):
             return decoded
+        # Decoded bytes and builtin containers are matched by class,
+        #   skipping the generic checks below.
+        cls = decoded.__class__
+        if cls is str:
+            return t(decoded)  # type: ignore[call-arg]
+        if cls is dict:
+            return t(**decoded)
+        if cls is list or cls is tuple:
+            return t(*decoded)
         # Represent date/time objects as time since unix epoch.
-        if isinstance(val, (datetime.date, datetime.time, datetime.timedelta)):
+        if val.__class__ in _DATETIME_CLASSES or isinstance(val, _DATETIME_TYPES):
             decoded = serdes.unixtime(val)
+            cls = decoded.__class__
         # Treat containers as constructor args.
-        if inspection.ismappingtype(decoded.__class__):
-            return self.t(**decoded)
-        if inspection.isiterabletype(decoded.__class__) and not inspection.istexttype(
-            decoded.__class__
-        ):
-            return self.t(*decoded)
+        if inspection.ismappingtype(cls):
+            return t(**decoded)
+        if inspection.isiterabletype(cls) and not inspection.istexttype(cls):
+            return t(*decoded)
         # Simple cast for non-containers.
-        return self.t(decoded)  # type: ignore[call-arg]
+        return t(decoded)  # type: ignore[call-arg]
 
 
 DecimalT = tp.TypeVar("DecimalT", bound=decimal.Decimal)
@@ -233,10 +301,60 @@ FractionT = tp.TypeVar("FractionT", bound=fractions.Fraction)
 FractionUnmarshaller = NumberUnmarshaller[FractionT]
 
 
+def _isoparse(
+    val: str,
+    t: type,
+    fromisoformat: tp.Callable[[str], tp.Any],
+    *,
+    utc: bool,
+) -> tp.Any:
+    # Try the native ISO 8601 parser before falling back to our general parser.
+    #   Purely numeric strings are timestamps, which the native parser may misread.
+    if not val.isdigit():
+        try:
+            parsed = fromisoformat(val)
+        except ValueError:
+            pass
+        else:
+            # Our general parser assumes naive values are at UTC, so match it.
+            if utc and parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=_UTC)
+            return parsed
+    return serdes.dateparse(val, t)
+
+
+_ISOFormatT = tp.TypeVar("_ISOFormatT", bound=tp.Union[datetime.date, datetime.time])
+
+
+class _ISOFormatUnmarshaller(
+    AbstractUnmarshaller[_ISOFormatT], tp.Generic[_ISOFormatT]
+):
+    """Base for unmarshallers which parse strings with the bound type's `fromisoformat`."""
+
+    fromisoformat: tp.Callable[[str], datetime.date | datetime.time]
+
+    __slots__ = ("fromisoformat",)
+
+    def __init__(
+        self, t: type[_ISOFormatT], context: ContextT, *, var: str | None = None
+    ):
+        """Constructor.
+
+        Args:
+            t: The type to unmarshal into.
+            context: Any nested type context (unused).
+            var: A variable name for the indicated type annotation (unused, optional).
+        """
+        super().__init__(t, context, var=var)
+        self.fromisoformat = t.fromisoformat
+
+
 DateT = tp.TypeVar("DateT", bound=datetime.date)
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+_SECONDS_PER_DAY = 86_400
 
 
-class DateUnmarshaller(AbstractUnmarshaller[DateT], tp.Generic[DateT]):
+class DateUnmarshaller(_ISOFormatUnmarshaller[DateT], tp.Generic[DateT]):
     """Unmarshaller that converts an input to a [`datetime.date`][] (or subclasses).
 
     Notes:
@@ -268,33 +386,39 @@ class DateUnmarshaller(AbstractUnmarshaller[DateT], tp.Generic[DateT]):
         Args:
             val: The input value to unmarshal.
         """
-        if isinstance(val, self.t) and not isinstance(val, datetime.datetime):
+        t = self.t
+        if val.__class__ is t:
+            return val
+        if isinstance(val, t) and not isinstance(val, datetime.datetime):
             return val
 
-        # Numbers can be treated as time since epoch.
-        if isinstance(val, (int, float)):
-            val = datetime.datetime.fromtimestamp(val, tz=datetime.timezone.utc)
-        # Always decode bytes.
-        decoded = serdes.decode(val)
+        # Numbers can be treated as time since epoch, at UTC.
+        #   We only need the day, so there's no need to build a full datetime.
+        if isinstance(val, _TIMESTAMP_TYPES):
+            return t.fromordinal(_EPOCH_ORDINAL + int(val // _SECONDS_PER_DAY))
+        # Always decode bytes. Strings are the most common input, and need no decoding.
+        decoded = val if val.__class__ is str else serdes.decode(val)
         # Parse strings.
         date: datetime.date | datetime.time = (
-            serdes.dateparse(decoded, self.t) if isinstance(decoded, str) else decoded
+            _isoparse(decoded, self.t, self.fromisoformat, utc=False)
+            if isinstance(decoded, str)
+            else decoded
         )
         # Time-only construct is treated as today.
         if isinstance(date, datetime.time):
-            date = datetime.datetime.now(tz=datetime.timezone.utc).today()
+            date = datetime.datetime.now(tz=_UTC).today()
         # Exact class matching - the parser returns subclasses.
-        if date.__class__ is self.t:
+        if date.__class__ is t:
             return date  # type: ignore[return-value]
         # Reconstruct as the exact type.
-        return self.t(year=date.year, month=date.month, day=date.day)
+        return t(date.year, date.month, date.day)
 
 
 DateTimeT = tp.TypeVar("DateTimeT", bound=datetime.datetime)
 
 
 class DateTimeUnmarshaller(
-    AbstractUnmarshaller[datetime.datetime], tp.Generic[DateTimeT]
+    _ISOFormatUnmarshaller[datetime.datetime], tp.Generic[DateTimeT]
 ):
     """Unmarshaller that converts an input to a [`datetime.datetime`][] (or subclasses).
 
@@ -332,21 +456,24 @@ class DateTimeUnmarshaller(
         Args:
             val: The input value to unmarshal.
         """
-        if isinstance(val, self.t):
+        t = self.t
+        if val.__class__ is t or isinstance(val, t):
             return val
 
-        # Numbers can be treated as time since epoch.
-        if isinstance(val, (int, float)):
-            val = datetime.datetime.fromtimestamp(val, tz=datetime.timezone.utc)
+        # Numbers can be treated as time since epoch, at UTC.
+        if isinstance(val, _TIMESTAMP_TYPES):
+            return self.t.fromtimestamp(val, tz=_UTC)
         # Always decode bytes.
-        decoded = serdes.decode(val)
+        decoded = val if val.__class__ is str else serdes.decode(val)
         # Parse strings.
         dt: datetime.datetime | datetime.date | datetime.time = (
-            serdes.dateparse(decoded, self.t) if isinstance(decoded, str) else decoded
+            _isoparse(decoded, self.t, self.fromisoformat, utc=True)
+            if isinstance(decoded, str)
+            else decoded
         )
         # If we have a time object, default to today.
         if isinstance(dt, datetime.time):
-            return self.t.now(tz=dt.tzinfo).replace(
+            return t.now(tz=dt.tzinfo).replace(
                 hour=dt.hour,
                 minute=dt.minute,
                 second=dt.second,
@@ -354,31 +481,30 @@ class DateTimeUnmarshaller(
                 tzinfo=dt.tzinfo,
             )
         # Exact class matching.
-        if dt.__class__ is self.t:
+        if dt.__class__ is t:
             return dt  # type: ignore[return-value]
         # Subclass check for datetimes.
         if isinstance(dt, datetime.datetime):
-            return self.t(
-                year=dt.year,
-                month=dt.month,
-                day=dt.day,
-                hour=dt.hour,
-                minute=dt.minute,
-                second=dt.second,
-                microsecond=dt.microsecond,
-                tzinfo=dt.tzinfo,
+            # Positional arguments go straight to the C constructor.
+            return t(
+                dt.year,
+                dt.month,
+                dt.day,
+                dt.hour,
+                dt.minute,
+                dt.second,
+                dt.microsecond,
+                dt.tzinfo,
                 fold=dt.fold,
             )
         # Implicit: we have a date object.
-        return self.t(
-            year=dt.year, month=dt.month, day=dt.day, tzinfo=datetime.timezone.utc
-        )
+        return t(dt.year, dt.month, dt.day, tzinfo=_UTC)
 
 
 TimeT = tp.TypeVar("TimeT", bound=datetime.time)
 
 
-class TimeUnmarshaller(AbstractUnmarshaller[TimeT], tp.Generic[TimeT]):
+class TimeUnmarshaller(_ISOFormatUnmarshaller[TimeT], tp.Generic[TimeT]):
     """Unmarshaller that converts an input to a[`datetime.time`][] (or subclasses).
 
     Notes:
@@ -413,38 +539,36 @@ class TimeUnmarshaller(AbstractUnmarshaller[TimeT], tp.Generic[TimeT]):
         Args:
             val: The input value to unmarshal.
         """
-        if isinstance(val, self.t):
+        t = self.t
+        if val.__class__ is t or isinstance(val, t):
             return val
 
-        decoded = serdes.decode(val)
-        if isinstance(decoded, (int, float)):
-            decoded = (
-                datetime.datetime.fromtimestamp(val, tz=datetime.timezone.utc)
-                .time()
-                # datetime.time() strips tzinfo...
-                .replace(tzinfo=datetime.timezone.utc)
+        decoded = val if val.__class__ is str else serdes.decode(val)
+        if isinstance(decoded, _TIMESTAMP_TYPES):
+            # datetime.timetz() keeps the tzinfo, unlike datetime.time().
+            decoded = _fromtimestamp(val, tz=_UTC).timetz()
+        dt: datetime.datetime | datetime.date | datetime.time
+        if isinstance(decoded, str):
+            # The native time parser reads some date-like strings as a time with an
+            #   offset (e.g., "2024-01" as 20:24-01:00), so only use it for clock times.
+            dt = (
+                _isoparse(decoded, self.t, self.fromisoformat, utc=True)
+                if ":" in decoded
+                else serdes.dateparse(decoded, self.t)
             )
-        dt: datetime.datetime | datetime.date | datetime.time = (
-            serdes.dateparse(decoded, self.t) if isinstance(decoded, str) else decoded
-        )
+        else:
+            dt = decoded
 
         if isinstance(dt, datetime.datetime):
             # datetime.time() strips tzinfo...
             dt = dt.time().replace(tzinfo=dt.tzinfo)
         elif isinstance(dt, datetime.date):
-            dt = self.t(tzinfo=datetime.timezone.utc)
+            dt = t(tzinfo=_UTC)
 
-        if dt.__class__ is self.t:
+        if dt.__class__ is t:
             return dt  # type: ignore[return-value]
 
-        return self.t(
-            hour=dt.hour,
-            minute=dt.minute,
-            second=dt.second,
-            microsecond=dt.microsecond,
-            tzinfo=dt.tzinfo,
-            fold=dt.fold,
-        )
+        return t(dt.hour, dt.minute, dt.second, dt.microsecond, dt.tzinfo, fold=dt.fold)
 
 
 TimeDeltaT = tp.TypeVar("TimeDeltaT", bound=datetime.timedelta)
@@ -477,26 +601,31 @@ class TimeDeltaUnmarshaller(AbstractUnmarshaller[TimeDeltaT], tp.Generic[TimeDel
 
     """
 
+    __slots__ = ()
+
     def __call__(self, val: tp.Any) -> TimeDeltaT:
         """Unmarshal a value into the bound `TimeDeltaT` type.
 
         Args:
             val: The input value to unmarshal.
         """
-        if isinstance(val, (int, float)):
-            return self.t(seconds=int(val))
+        t = self.t
+        if val.__class__ is t:
+            return val
+        if isinstance(val, _TIMESTAMP_TYPES):
+            return t(seconds=int(val))
 
-        decoded = serdes.decode(val)
+        decoded = serdes.decode(val) if isinstance(val, _BYTES_TYPES) else val
         td: datetime.timedelta = (
             serdes.dateparse(decoded, t=datetime.timedelta)
             if isinstance(decoded, str)
             else decoded
         )
 
-        if td.__class__ is self.t:
+        if td.__class__ is t:
             return td  # type: ignore[return-value]
 
-        return self.t(seconds=td.total_seconds())
+        return t(days=td.days, seconds=td.seconds, microseconds=td.microseconds)
 
 
 UUIDT = tp.TypeVar("UUIDT", bound=uuid.UUID)
@@ -519,6 +648,8 @@ class UUIDUnmarshaller(AbstractUnmarshaller[UUIDT], tp.Generic[UUIDT]):
         the two most common formats are a standard string encoding, or an integer encoding.
     """
 
+    __slots__ = ()
+
     def __call__(self, val: tp.Any) -> UUIDT:
         """Unmarshal a value into the bound `UUIDT` type.
 
@@ -528,12 +659,25 @@ class UUIDUnmarshaller(AbstractUnmarshaller[UUIDT], tp.Generic[UUIDT]):
         See Also:
             - [`typelib.serdes.load`][]
         """
-        decoded = serdes.load(val)
+        t = self.t
+        cls = val.__class__
+        if cls is t:
+            return val
+        if cls is int:
+            return t(int=val)
+        # Canonical hex strings don't need to go through the general-purpose loader.
+        #   Numeric strings are decoded as integers, so they must take the long way.
+        if cls is str and len(val) in (32, 36) and not val.isdigit():
+            try:
+                return t(val)
+            except ValueError:
+                pass
+        decoded = val if cls in _NATIVE_TYPES else serdes.load(val)
         if isinstance(decoded, int):
-            return self.t(int=decoded)
-        if isinstance(decoded, self.t):
+            return t(int=decoded)
+        if isinstance(decoded, t):
             return decoded
-        return self.t(decoded)  # type: ignore[arg-type]
+        return t(decoded)  # type: ignore[arg-type]
 
 
 PatternT = tp.TypeVar("PatternT", bound=re.Pattern)
@@ -551,9 +695,18 @@ class PatternUnmarshaller(AbstractUnmarshaller[PatternT], tp.Generic[PatternT]):
         - [`typelib.serdes.decode`][]
     """
 
+    __slots__ = ()
+
     def __call__(self, val: tp.Any) -> PatternT:
-        decoded = serdes.decode(val)
-        return re.compile(decoded)  # type: ignore[return-value]
+        if val.__class__ is self.t:
+            return val
+        decoded = serdes.decode(val) if isinstance(val, _BYTES_TYPES) else val
+        return _compile_pattern(decoded)  # type: ignore[return-value]
+
+
+@compat.lru_cache(maxsize=1_000)
+def _compile_pattern(pattern: str | re.Pattern) -> re.Pattern:
+    return re.compile(pattern)
 
 
 class CastUnmarshaller(AbstractUnmarshaller[T]):
@@ -586,10 +739,15 @@ class CastUnmarshaller(AbstractUnmarshaller[T]):
         Args:
             val: The input value to unmarshal.
         """
+        # Compare against the origin, since `t` may be a generic alias (e.g., `Mapping`).
+        origin = self.origin
+        cls = val.__class__
+        if cls is origin:
+            return val
         # Try to load the string, if this is JSON or a literal expression.
-        decoded = serdes.load(val)
+        decoded = val if cls in _NATIVE_TYPES else serdes.load(val)
         # Short-circuit cast if we have the type we want.
-        if isinstance(decoded, self.t):
+        if decoded.__class__ is origin or isinstance(decoded, self.t):
             return decoded
         # Cast the decoded value to the type.
         return self.caster(decoded)
@@ -617,7 +775,7 @@ class LiteralUnmarshaller(AbstractUnmarshaller[LiteralT], tp.Generic[LiteralT]):
         - [`typelib.serdes.load`][]
     """
 
-    __slots__ = ("values",)
+    __slots__ = ("values", "members")
 
     def __init__(self, t: type[LiteralT], context: ContextT, *, var: str | None = None):
         """Constructor.
@@ -629,15 +787,22 @@ class LiteralUnmarshaller(AbstractUnmarshaller[LiteralT], tp.Generic[LiteralT]):
         """
         super().__init__(t, context, var=var)
         self.values = inspection.args(t, evaluate=True)
+        # Literal members are always hashable, so we can test membership in O(1).
+        self.members = frozenset(self.values)
 
     def __call__(self, val: tp.Any) -> LiteralT:
-        if val in self.values:
-            return val
-        decoded = serdes.load(val)
-        if decoded in self.values:
-            return decoded  # type: ignore[return-value]
+        members = self.members
+        try:
+            if val in members:
+                return val
+            decoded = val if val.__class__ in _NATIVE_TYPES else serdes.load(val)
+            if decoded in members:
+                return decoded  # type: ignore[return-value]
+        # Unhashable inputs can't be a member.
+        except TypeError:
+            pass
 
-        raise ValueError(f"{decoded!r} is not one of {self.values!r}")
+        raise ValueError(f"{val!r} is not one of {self.values!r}")
 
 
 UnionT = tp.TypeVar("UnionT")
@@ -655,18 +820,19 @@ class UnionUnmarshaller(AbstractUnmarshaller[UnionT], tp.Generic[UnionT]):
 
         Our algorithm is intentionally simple:
 
-        1. We iterate through each union member from top to bottom and call the
+        1. If the union is optional and the input is `None`, return `None`.
+        2. We iterate through each union member from top to bottom and call the
            resolved unmarshaller, returning the result.
-        2. If any of `(ValueError, TypeError, SyntaxError)`, try again with the
+        3. If any of `(ValueError, TypeError, SyntaxError)`, try again with the
            next unmarshaller.
-        3. If all unmarshallers fail, then we have an invalid input, raise an error.
+        4. If all unmarshallers fail, then we have an invalid input, raise an error.
 
     Tip: TL;DR
         In order to ensure correctness, you should treat your union members as a stack,
         sorted from most-strict initialization to least-strict.
     """
 
-    __slots__ = ("stack", "ordered_routines")
+    __slots__ = ("stack", "ordered_routines", "nullable")
 
     def __init__(self, t: type[UnionT], context: ContextT, *, var: str | None = None):
         """Constructor.
@@ -678,10 +844,16 @@ class UnionUnmarshaller(AbstractUnmarshaller[UnionT], tp.Generic[UnionT]):
         """
         super().__init__(t, context, var=var)
         self.stack = inspection.args(t, evaluate=True)
-        if inspection.isoptionaltype(t):
+        self.nullable = inspection.isoptionaltype(t)
+        if self.nullable:
             self.stack = (self.stack[-1], *self.stack[:-1])
 
-        self.ordered_routines = [self.context[typ] for typ in self.stack]
+        self.ordered_routines = [
+            routine
+            for routine in (self.context[typ] for typ in self.stack)
+            # `None` is handled up-front, any other input would fail this routine.
+            if not isinstance(routine, NoneTypeUnmarshaller)
+        ]
 
     def __call__(self, val: tp.Any) -> UnionT:
         """Unmarshal a value into the bound `UnionT`.
@@ -692,12 +864,14 @@ class UnionUnmarshaller(AbstractUnmarshaller[UnionT], tp.Generic[UnionT]):
         Raises:
             ValueError: If `val` cannot be unmarshalled into any member type.
         """
+        if val is None and self.nullable:
+            return None  # type: ignore[return-value]
+
         for routine in self.ordered_routines:
-            with contextlib.suppress(
-                ValueError, TypeError, SyntaxError, AttributeError
-            ):
-                unmarshalled = routine(val)
-                return unmarshalled
+            try:
+                return routine(val)
+            except _UNION_MEMBER_ERRORS:
+                continue
 
         raise ValueError(f"{val!r} is not one of types {self.stack!r}")
 
@@ -757,11 +931,12 @@ class SubscriptedMappingUnmarshaller(
             val: The input value to unmarshal.
         """
         # Always decode bytes.
-        decoded = serdes.load(val)
-        keys = self.keys
-        values = self.values
-        return self.origin(  # type: ignore[call-arg]
-            ((keys(k), values(v)) for k, v in serdes.iteritems(decoded))
+        decoded = val if val.__class__ in _NATIVE_TYPES else serdes.load(val)
+        origin, keys, values = self.origin, self.keys, self.values
+        if origin is dict:
+            return {keys(k): values(v) for k, v in serdes.iteritems(decoded)}  # type: ignore[return-value]
+        return origin(  # type: ignore[call-arg]
+            [(keys(k), values(v)) for k, v in serdes.iteritems(decoded)]
         )
 
 
@@ -814,9 +989,8 @@ class SubscriptedIterableUnmarshaller(
             val: The input value to unmarshal.
         """
         # Always decode bytes.
-        decoded = serdes.load(val)
-        values = self.values
-        return self.origin((values(v) for v in serdes.itervalues(decoded)))  # type: ignore[call-arg]
+        decoded = val if val.__class__ in _NATIVE_TYPES else serdes.load(val)
+        return self.origin(map(self.values, serdes.itervalues(decoded)))  # type: ignore[call-arg]
 
 
 IteratorT = tp.TypeVar("IteratorT", bound=tp.Iterator)
@@ -867,7 +1041,7 @@ class SubscriptedIteratorUnmarshaller(
             val: The input value to unmarshal.
         """
         # Always decode bytes.
-        decoded = serdes.load(val)
+        decoded = val if val.__class__ in _NATIVE_TYPES else serdes.load(val)
         values = self.values
         it: IteratorT = (values(v) for v in serdes.itervalues(decoded))  # type: ignore[assignment]
         return it
@@ -917,7 +1091,7 @@ class FixedTupleUnmarshaller(AbstractUnmarshaller[compat.TupleT]):
         """
         super().__init__(t, context, var=var)
         self.stack = inspection.args(t, evaluate=True)
-        self.ordered_routines = [self.context[vt] for vt in self.stack]
+        self.ordered_routines = tuple(self.context[vt] for vt in self.stack)
 
     def __call__(self, val: tp.Any) -> compat.TupleT:
         """Unmarshal a value into the bound [`tuple`][] structure.
@@ -925,10 +1099,12 @@ class FixedTupleUnmarshaller(AbstractUnmarshaller[compat.TupleT]):
         Args:
             val: The input value to unmarshal.
         """
-        decoded = serdes.load(val)
+        decoded = val if val.__class__ in _NATIVE_TYPES else serdes.load(val)
         return self.origin(
-            routine(v)
-            for routine, v in zip(self.ordered_routines, serdes.itervalues(decoded))
+            [
+                routine(v)
+                for routine, v in zip(self.ordered_routines, serdes.itervalues(decoded))
+            ]
         )
 
 
@@ -1000,7 +1176,21 @@ class StructuredTypeUnmarshaller(AbstractUnmarshaller[_ST]):
         Args:
             val: The input value to unmarshal.
         """
-        decoded = serdes.load(val)
+        decoded = val if val.__class__ in _NATIVE_TYPES else serdes.load(val)
         fields = self.fields_by_var
-        kwargs = {f: fields[f](v) for f, v in serdes.iteritems(decoded) if f in fields}
+        # Dicts are the common case, walk our fixed schema rather than the input.
+        if isinstance(decoded, dict):
+            get = decoded.get
+            kwargs = {
+                f: m(v)
+                for f, m in fields.items()
+                if (v := get(f, _MISSING)) is not _MISSING
+            }
+        else:
+            get_routine = fields.get
+            kwargs = {
+                f: m(v)
+                for f, v in serdes.iteritems(decoded)
+                if (m := get_routine(f)) is not None
+            }
         return self.t(**kwargs)
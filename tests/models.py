@@ -59,6 +59,10 @@ class GivenEnum(enum.Enum):
     one = "one"
 
 
+class NumericStrEnum(str, enum.Enum):
+    one = "1"
+
+
 @dataclasses.dataclass
 class UnionSTDLib:
     timestamp: datetime.datetime | None = None
@@ -105,3 +105,14 @@ def test_static_order(given_type, expected_nodes):
     nodes = graph.static_order(given_type)
     # Then
     assert nodes == expected_nodes
+
+
+def test_static_order_is_not_shared():
+    # Given
+    given_type = dict[str, int]
+    given_nodes = graph.static_order(given_type)
+    # When
+    given_nodes.clear()
+    nodes = graph.static_order(given_type)
+    # Then
+    assert nodes
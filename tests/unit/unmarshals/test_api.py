@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import dataclasses
 import datetime
 import decimal
 import fractions
+import gc
 import pathlib
 import re
 import typing
 import uuid
+import weakref
 
 import pytest
 
@@ -178,3 +181,84 @@ def test_unmarshal(given_type, given_input, expected_output):
     output = api.unmarshal(given_type, given_input)
     # Then
     assert output == expected_output
+
+
+def test_unmarshal_many():
+    # Given
+    given_type = models.Data
+    given_values = [{"field": "1", "value": "2"}, '{"field": "3", "value": 4}']
+    expected_output = [models.Data(field="1", value=2), models.Data(field="3", value=4)]
+    # When
+    output = api.unmarshal_many(given_type, given_values)
+    # Then
+    assert output == expected_output
+
+
+def test_delayed_unmarshaller_delegates():
+    # Given
+    given_proxy = api.DelayedUnmarshaller(refs.forwardref("decimal.Decimal"), {})
+    expected_resolved = api.unmarshaller(decimal.Decimal)
+    # When
+    output = given_proxy("1.0")
+    # Then
+    assert output == decimal.Decimal("1.0")
+    assert given_proxy.resolved is expected_resolved
+    assert type(given_proxy) is api.DelayedUnmarshaller
+
+
+def test_delayed_unmarshaller_keeps_var():
+    # Given
+    given_proxy = api.DelayedUnmarshaller(
+        refs.forwardref("decimal.Decimal"), {}, var="field"
+    )
+    # When
+    given_proxy("1.0")
+    # Then
+    assert given_proxy.t is decimal.Decimal
+    assert given_proxy.var == "field"
+
+
+@pytest.mark.suite(
+    any=dict(given_type=typing.Any),
+    iterator=dict(given_type=typing.Iterator),
+)
+def test_noop_unmarshaller_keeps_root_type(given_type):
+    # When
+    routine = api.unmarshaller(given_type)
+    # Then
+    assert routine.t is given_type
+
+
+@pytest.fixture()
+def isolated_unmarshaller(monkeypatch):
+    # Give each test its own cache, so clearing it leaves the session's cache intact.
+    isolated = compat.cache(api.unmarshaller.__wrapped__)
+    monkeypatch.setattr(api, "unmarshaller", isolated)
+    return isolated
+
+
+def test_unmarshaller_shares_routines_across_roots(isolated_unmarshaller):
+    # Given
+    @dataclasses.dataclass
+    class Shared:
+        value: int
+
+    # When
+    list_routine = isolated_unmarshaller(list[Shared])
+    dict_routine = isolated_unmarshaller(dict[str, Shared])
+    # Then
+    assert list_routine.context[Shared] is dict_routine.context[Shared]
+
+
+def test_unmarshaller_releases_shared_routines(isolated_unmarshaller):
+    # Given
+    @dataclasses.dataclass
+    class Shared:
+        value: int
+
+    given_routine = weakref.ref(isolated_unmarshaller(list[Shared]).context[Shared])
+    # When
+    isolated_unmarshaller.cache_clear()
+    gc.collect()
+    # Then
+    assert given_routine() is None
@@ -83,6 +83,7 @@ def test_number_unmarshaller(given_input, given_type, expected_output):
     bytes_number=dict(given_input=b"1", expected_output=datetime.date(1970, 1, 1)),
     string_number=dict(given_input="1", expected_output=datetime.date(1970, 1, 1)),
     number=dict(given_input=1, expected_output=datetime.date(1970, 1, 1)),
+    number_negative=dict(given_input=-1.5, expected_output=datetime.date(1969, 12, 31)),
     date_bytes=dict(
         given_input=b"1969-12-31",
         expected_output=datetime.date(1969, 12, 31),
@@ -148,6 +149,22 @@ def test_date_unmarshaller(given_input, expected_output):
         given_input="1969-12",
         expected_output=datetime.datetime(1969, 12, 1, tzinfo=datetime.timezone.utc),
     ),
+    datetime_string=dict(
+        given_input="1969-12-31T01:00:00+01:00",
+        expected_output=datetime.datetime(
+            1969,
+            12,
+            31,
+            hour=1,
+            tzinfo=datetime.timezone(datetime.timedelta(hours=1)),
+        ),
+    ),
+    datetime_string_naive=dict(
+        given_input="1969-12-31T01:00:00",
+        expected_output=datetime.datetime(
+            1969, 12, 31, hour=1, tzinfo=datetime.timezone.utc
+        ),
+    ),
     datetime=dict(
         given_input=datetime.datetime(1969, 12, 31),
         expected_output=datetime.datetime(1969, 12, 31),
@@ -203,6 +220,14 @@ def test_datetime_unmarshaller(given_input, expected_output):
         given_input="01:00:00+00:00",
         expected_output=datetime.time(hour=1, tzinfo=datetime.timezone.utc),
     ),
+    time_string_naive=dict(
+        given_input="01:00:00",
+        expected_output=datetime.time(hour=1, tzinfo=datetime.timezone.utc),
+    ),
+    year_month_string=dict(
+        given_input="2024-01",
+        expected_output=datetime.time(tzinfo=datetime.timezone.utc),
+    ),
     datetime_string=dict(
         given_input="1969-12-31T01:00:00+00:00",
         expected_output=datetime.time(hour=1, tzinfo=datetime.timezone.utc),
@@ -277,6 +302,10 @@ def test_timedelta_unmarshaller(given_input, expected_output):
         given_input="00000000-0000-0000-0000-000000000001",
         expected_output=uuid.UUID(int=1),
     ),
+    string_hex=dict(
+        given_input="0000000000000000000000000000000a",
+        expected_output=uuid.UUID(int=10),
+    ),
     bytes=dict(
         given_input=b"00000000-0000-0000-0000-000000000001",
         expected_output=uuid.UUID(int=1),
@@ -517,6 +546,15 @@ def test_literal_unmarshaller(
         },
         expected_output=datetime.date.today(),
     ),
+    optional_none_first=dict(
+        given_input=None,
+        given_union=typing.Union[None, str],
+        given_context={
+            str: routines.StringUnmarshaller(str, {}),
+            type(None): routines.NoneTypeUnmarshaller(type(None), {}),
+        },
+        expected_output=None,
+    ),
 )
 def test_union_unmarshaller(given_input, given_union, given_context, expected_output):
     # Given
@@ -812,6 +850,16 @@ def test_invalid_literal():
         given_unmarshaller(given_value)
 
 
+def test_invalid_literal_unhashable():
+    # Given
+    given_unmarshaller = routines.LiteralUnmarshaller(typing.Literal[1], {})
+    given_value = [1]
+    expected_exception = ValueError
+    # When/Then
+    with pytest.raises(expected_exception):
+        given_unmarshaller(given_value)
+
+
 def test_invalid_union():
     # Given
     given_unmarshaller = routines.UnionUnmarshaller(
@@ -837,3 +885,36 @@ def test_enum_unmarshaller():
     unmarshalled = given_unmarshaller(given_value)
     # Then
     assert unmarshalled == expected_value
+
+
+def test_enum_unmarshaller_member():
+    # Given
+    given_unmarshaller = routines.EnumUnmarshaller(models.NumericStrEnum, {})
+    given_value = models.NumericStrEnum.one
+    expected_value = models.NumericStrEnum.one
+    # When
+    unmarshalled = given_unmarshaller(given_value)
+    # Then
+    assert unmarshalled is expected_value
+
+
+def test_call_many():
+    # Given
+    given_unmarshaller = routines.NumberUnmarshaller(int, {})
+    given_values = ["1", b"2", 3.0]
+    expected_output = [1, 2, 3]
+    # When
+    unmarshalled = given_unmarshaller.call_many(given_values)
+    # Then
+    assert unmarshalled == expected_output
+
+
+def test_noop_call_many():
+    # Given
+    given_unmarshaller = routines.NoOpUnmarshaller(typing.Any, {})
+    given_values = (v for v in ("1", 2))
+    expected_output = ["1", 2]
+    # When
+    unmarshalled = given_unmarshaller.call_many(given_values)
+    # Then
+    assert unmarshalled == expected_output